@@ -2,7 +2,13 @@
 
 import sys
 from argparse import ArgumentParser, RawTextHelpFormatter
-from firedrake import *
+from firedrake import (Mesh, UnitSquareMesh, MeshHierarchy, SpatialCoordinate,
+                       FunctionSpace, VectorFunctionSpace, Function, Constant,
+                       TestFunction, TrialFunction, TestFunctions, TrialFunctions,
+                       DirichletBC, MixedVectorSpaceBasis, VectorSpaceBasis,
+                       LinearVariationalProblem, LinearVariationalSolver,
+                       PCBase, AuxiliaryOperatorPC, assemble, action, File,
+                       as_vector, inner, grad, div, dx, sin, cos, sqrt, pi)
 from firedrake.petsc import PETSc
 
 parser = ArgumentParser(description="""
@@ -47,9 +53,11 @@ parser.add_argument('-refine', type=int, default=0, metavar='R',
 parser.add_argument('-schurgmg', metavar='X', default='',
                     help='Schur+GMG PC solver package: diag|lower|full')
 parser.add_argument('-schurpre', metavar='X', default='selfp',
-                    help='how Schur block is preconditioned: selfp|mass')
+                    help='how Schur block is preconditioned: selfp|gmg|mass|lumped')
 parser.add_argument('-showinfo', action='store_true', default=False,
                     help='print function space sizes and solution norms')
+parser.add_argument('-sweep', metavar='R,R,...', type=str, default='',
+                    help='solve at each listed -refine level, reusing the mesh hierarchy')
 parser.add_argument('-stokeshelp', action='store_true', default=False,
                     help='help for stokes.py options')
 parser.add_argument('-udegree', type=int, default=2, metavar='K',
@@ -58,99 +66,20 @@ parser.add_argument('-vectorlap', action='store_true', default=False,
                     help='use vector laplacian residual formula')
 args, unknown = parser.parse_known_args()
 assert not (args.analytical and args.nobase), 'conflict in problem choice options'
+assert not (len(args.sweep) > 0 and len(args.o) > 0), 'no -o output with -sweep'
 
 # -stokeshelp is for help with stokes.py
 if args.stokeshelp:
     parser.print_help()
 
-# read Gmsh mesh or create uniform mesh
-if len(args.mesh) > 0:
-    assert (not args.analytical), 'Gmsh file not allowed for -analytical problem'
-    assert (not args.nobase), 'Gmsh file not allowed for -nobase problem'
-    PETSc.Sys.Print('reading mesh from %s ...' % args.mesh)
-    mesh = Mesh(args.mesh)
-    meshstr = ' on mesh'
-    other = (41,)
-    lid = (40,)
-else:
-    mx, my = args.mx, args.my
-    mesh = UnitSquareMesh(mx-1, my-1, quadrilateral=args.quad)
-    mx, my = (mx-1) * 2**args.refine + 1, (my-1) * 2**args.refine + 1
-    meshstr = ' on %d x %d grid' % (mx,my)
-    # boundary i.d.s:    ---4---
-    #                    |     |
-    #                    1     2
-    #                    |     |
-    #                    ---3---
-    if args.nobase:
-        other = (1,2)
-    else:
-        other = (1,2,3)
-    lid = (4,)
-
-# enable GMG using hierarchy
-if args.refine > 0:
-    hierarchy = MeshHierarchy(mesh, args.refine)
-    mesh = hierarchy[-1]     # the fine mesh
-    if len(args.mesh) > 0:
-        meshstr += ' (%d levels refinement)' % args.refine
-x,y = SpatialCoordinate(mesh)
-mesh.topology_dm.viewFromOptions('-dm_view')
-
-# define mixed finite elements; for family names see
-#   https://www.firedrakeproject.org/variational-problems.html#supported-finite-elements
-V = VectorFunctionSpace(mesh, 'CG', degree=args.udegree)  # CG = Lagrange
-if args.dp:
-    W = FunctionSpace(mesh, 'DG', degree=args.pdegree)  # DG = Discontinuous Lagrange
-else:
-    W = FunctionSpace(mesh, 'CG', degree=args.pdegree)
-Z = V * W
-
-# define body force and Dir. boundary condition (on velocity only)
-#     note: UFL as_vector() takes UFL expressions and combines
-if args.analytical:
-    assert (len(args.mesh) == 0)  # require UnitSquareMesh
-    assert (args.mu == 1.0)
-    f_body = as_vector([ 28.0 * pi*pi * sin(4.0*pi*x) * cos(4.0*pi*y), \
-                       -36.0 * pi*pi * cos(4.0*pi*x) * sin(4.0*pi*y)])
-    u_12 = Function(V).interpolate(as_vector([0.0,-sin(4.0*pi*y)]))
-    u_34 = Function(V).interpolate(as_vector([sin(4.0*pi*x),0.0]))
-    bcs = [ DirichletBC(Z.sub(0), u_12, (1,2)),
-            DirichletBC(Z.sub(0), u_34, (3,4)) ]
-else:
-    f_body = Constant((0.0, 0.0))  # no body force in lid-driven cavity
-    u_noslip = Constant((0.0, 0.0))
-    ux_lid = args.lidscale * x * (1.0 - x)
-    u_lid = Function(V).interpolate(as_vector([ux_lid,0.0]))
-    bcs = [ DirichletBC(Z.sub(0), u_noslip, other),
-            DirichletBC(Z.sub(0), u_lid,    lid)   ]
-
-# if Dirichlet-only b.c.s on velocity then set nullspace to constant pressure
-if args.nobase:
-    ns = None
-else:
-    ns = MixedVectorSpaceBasis(Z, [Z.sub(0), VectorSpaceBasis(constant=True)])
-
-# define weak form
-up = Function(Z)
-u,p = split(up)
-v,q = TestFunctions(Z)
-if args.vectorlap:   # form which is special to constant viscosity
-    F = (args.mu * inner(grad(u), grad(v)) - p * div(v) - div(u) * q \
-         - inner(f_body,v)) * dx
-else:                # form that generalizes to variable or nonlinear viscosity
-    Du = 0.5 * (grad(u)+grad(u).T)
-    Dv = 0.5 * (grad(v)+grad(v).T)
-    F = (2.0 * args.mu * inner(Du,Dv) - p * div(v) - div(u) * q \
-         - inner(f_body,v)) * dx
-
 # some fieldsplit/Schur solver notes:
 # 1. -s_pc_fieldsplit_type schur
 #       This is the ONLY viable fieldsplit type.  The others (i.e. additive,
 #       multiplicative, and symmetric_multiplicative) all fail because the
 #       pressure block is zero, thus non-invertible, in a stable mixed method.
 # 2. -s_pc_fieldsplit_schur_factorization_type diag
-#       The Murphy et al 2000 theorem applies to MINRES with this option.
+#       The Murphy et al 2000 theorem applies to MINRES with this option,
+#       so -schurgmg diag sets, and requires, -s_ksp_type minres.
 #       The default for diag is -pc_fieldsplit_schur_scale -1.0.  However,
 #       We do NOT want this sign flip when using Mass for preconditioning
 #       because Mass is already SPD.
@@ -160,29 +89,46 @@ else:                # form that generalizes to variable or nonlinear viscosity
 #         https://www.firedrakeproject.org/demos/geometric_multigrid.py.html
 #       The class Mass below, and the options below, are from this source.
 #       This preconditioner for S uses bjacobi+icc, allowed because the
-#       mass matrix is SPD.
+#       mass matrix is SPD.  With -quad it is instead diag(M)^{-1}: only
+#       the diagonal of the (unassembled) mass matrix M is computed.
+#       Alternatively, class LumpedMass replaces the mass matrix by its row
+#       sums, so application is a pointwise divide.
+#       Lumping is only safe for P^0, P^1, or Q^k pressure, which have
+#       positive row sums; for P^2 on triangles they are zero at vertices.
 # 4. -s_pc_fieldsplit_schur_precondition selfp
 #       When not using Mass we may go ahead and assemble the preconditioner for
 #       the A11 block, and this option APPROXIMATELY does so.  That is, it only
 #       inverts the diagonal of A00, so S' = - B inv(diag(A)) B^T
+#       This S' is then either preconditioned by Jacobi or by a GMG V-cycle.
+#       In the latter case the coarse-level S' are formed by Galerkin
+#       (R S' P) because rediscretizing the zero A11 block is useless.
 
-# common to all Schur + GMG based solver packages
-common = {'pc_type': 'fieldsplit',
+# common to all Schur + GMG based solver packages; in a MatNest the blocks
+# are stored separately, and the zero A11 block has empty sparsity
+common = {'mat_type': 'nest',
+          'pc_type': 'fieldsplit',
           'pc_fieldsplit_type': 'schur',
           'fieldsplit_0_ksp_type': 'preonly',
           'fieldsplit_0_pc_type': 'mg',
+          'fieldsplit_0_pc_mg_log': None,  # per-level events in -log_view
           'fieldsplit_1_ksp_type': 'preonly'}
 
-# specific Schur + GMG choices
-sgmg = {# diagonal Schur; use minres or gmres or fgmres
+# specific Schur + GMG choices; all inner solves are preonly so the
+# preconditioner is a fixed linear operator and fgmres is not needed
+sgmg = {# diagonal Schur; use minres
         'diag':
-           {'pc_fieldsplit_schur_fact_type': 'diag'},
-        # lower-triangular Schur; use gmres or fgmres
+           {'ksp_type': 'minres',
+            'pc_fieldsplit_schur_fact_type': 'diag'},
+        # lower-triangular Schur; use gmres
         'lower':
-           {'pc_fieldsplit_schur_fact_type': 'lower'},
-        # full Schur; use gmres or fgmres
+           {'ksp_type': 'gmres',
+            'ksp_gmres_restart': 20,  # caps Krylov basis memory
+            'pc_fieldsplit_schur_fact_type': 'lower'},
+        # full Schur; use gmres
         'full':
-           {'pc_fieldsplit_schur_fact_type': 'full'},
+           {'ksp_type': 'gmres',
+            'ksp_gmres_restart': 20,  # caps Krylov basis memory
+            'pc_fieldsplit_schur_fact_type': 'full'},
        }
 
 class Mass(AuxiliaryOperatorPC):
@@ -192,6 +138,34 @@ class Mass(AuxiliaryOperatorPC):
         bcs = None
         return (a, bcs)
 
+class LumpedMass(PCBase):
+
+    def initialize(self, pc):
+        from firedrake.dmhooks import get_function_space
+        # as in AuxiliaryOperatorPC, rebuild the (indexed) pressure subspace
+        Wsub = get_function_space(pc.getDM())
+        W = FunctionSpace(Wsub.mesh(), Wsub.ufl_element())
+        a = (1.0/args.mu) * inner(TestFunction(W), TrialFunction(W))*dx
+        # row sums of the mass matrix are the action on the constant one
+        lumped = assemble(action(a, Function(W).assign(1.0)))
+        with lumped.dat.vec_ro as vlumped:
+            self.diag = vlumped.copy()
+
+    def update(self, pc):
+        # the lumped mass does not depend on the solution
+        pass
+
+    def apply(self, pc, x, y):
+        y.pointwiseDivide(x, self.diag)
+
+    def applyTranspose(self, pc, x, y):
+        y.pointwiseDivide(x, self.diag)
+
+    def view(self, pc, viewer=None):
+        super().view(pc, viewer)
+        if viewer is not None:
+            viewer.printfASCII('lumped (diagonal) viscosity-weighted mass matrix\n')
+
 # choice of preconditioning method for Schur block
 spre = {# precondition Schur using "selfp" and Jacobi application
         'selfp':
@@ -199,18 +173,37 @@ spre = {# precondition Schur using "selfp" and Jacobi application
             'pc_fieldsplit_schur_scale': -1.0,  # only active for diag
             'fieldsplit_1_pc_type': 'jacobi',
             'fieldsplit_1_pc_jacobi_type': 'diagonal'},
-        # precondition Schur with mass-matrix and ICC application
+        # precondition Schur using "selfp" and GMG V-cycle application
+        'gmg':
+           {'pc_fieldsplit_schur_precondition': 'selfp',
+            'pc_fieldsplit_schur_scale': -1.0,  # only active for diag
+            'fieldsplit_1_pc_type': 'mg',
+            'fieldsplit_1_pc_mg_galerkin': 'pmat',
+            'fieldsplit_1_mg_levels_ksp_type': 'chebyshev',
+            'fieldsplit_1_mg_levels_pc_type': 'jacobi',
+            'fieldsplit_1_mg_coarse_pc_type': 'redundant',
+            'fieldsplit_1_mg_coarse_redundant_pc_factor_shift_type': 'inblocks'},
+        # precondition Schur with mass-matrix and ICC application; with -quad
+        # apply diag(M)^{-1}, without assembling M
         'mass':
            {'pc_fieldsplit_schur_precondition': 'a11',
             'pc_fieldsplit_schur_scale': 1.0,  # only active for diag
             'fieldsplit_1_pc_type': 'python',
             'fieldsplit_1_pc_python_type': '__main__.Mass',
-            'fieldsplit_1_aux_pc_type': 'bjacobi',
-            'fieldsplit_1_aux_sub_pc_type': 'icc'},
+            **({'fieldsplit_1_aux_mat_type': 'matfree',
+                'fieldsplit_1_aux_pc_type': 'jacobi'} if args.quad else
+               {'fieldsplit_1_aux_pc_type': 'bjacobi',
+                'fieldsplit_1_aux_sub_pc_type': 'icc'})},
+        # precondition Schur with lumped mass-matrix (pointwise divide)
+        'lumped':
+           {'pc_fieldsplit_schur_precondition': 'a11',
+            'pc_fieldsplit_schur_scale': 1.0,  # only active for diag
+            'fieldsplit_1_pc_type': 'python',
+            'fieldsplit_1_pc_python_type': '__main__.LumpedMass'},
        }
 
 # select solver package
-sparams = {'snes_type': 'ksponly'}  # applies to all
+sparams = {}
 if len(args.schurgmg) > 0:
     sparams.update(common)
     try:
@@ -223,55 +216,167 @@ if len(args.schurgmg) > 0:
     except KeyError:
         print('ERROR: invalid -schurpre; choices are %s' % list(spre.keys()))
         sys.exit(1)
+    if args.schurpre == 'lumped':
+        assert args.quad or args.pdegree <= 1, \
+            '-schurpre lumped requires -quad or -pdegree 0|1'
+    # the diag package and its Schur block scaling are set up for MINRES
+    if args.schurgmg == 'diag':
+        assert PETSc.Options().getString('s_ksp_type', 'minres') == 'minres', \
+            '-schurgmg diag requires -s_ksp_type minres'
+
+def l2norms(mesh, f, g):
+    '''Compute L^2 norms of f and g in one pass over the mesh, as the
+    components of a linear functional on the (2D) space of constant vectors.'''
+    r = TestFunction(VectorFunctionSpace(mesh, 'R', 0, dim=2))
+    sq = assemble((r[0] * inner(f, f) + r[1] * inner(g, g)) * dx)
+    return [sqrt(s) for s in sq.dat.data_ro]
+
+def run(args, mesh):
+    '''Solve the Stokes problem on mesh, the fine mesh of a hierarchy with
+    args.refine levels of refinement.'''
+    if len(args.mesh) > 0:
+        meshstr = ' on mesh'
+        if args.refine > 0:
+            meshstr += ' (%d levels refinement)' % args.refine
+        other = (41,)
+        lid = (40,)
+    else:
+        mx = (args.mx-1) * 2**args.refine + 1
+        my = (args.my-1) * 2**args.refine + 1
+        meshstr = ' on %d x %d grid' % (mx,my)
+        # boundary i.d.s:    ---4---
+        #                    |     |
+        #                    1     2
+        #                    |     |
+        #                    ---3---
+        if args.nobase:
+            other = (1,2)
+        else:
+            other = (1,2,3)
+        lid = (4,)
+    x,y = SpatialCoordinate(mesh)
+    mesh.topology_dm.viewFromOptions('-dm_view')
+
+    # define mixed finite elements; for family names see
+    #   https://www.firedrakeproject.org/variational-problems.html#supported-finite-elements
+    V = VectorFunctionSpace(mesh, 'CG', degree=args.udegree)  # CG = Lagrange
+    if args.dp:
+        W = FunctionSpace(mesh, 'DG', degree=args.pdegree)  # DG = Discontinuous Lagrange
+    else:
+        W = FunctionSpace(mesh, 'CG', degree=args.pdegree)
+    Z = V * W
+
+    # define body force and Dir. boundary condition (on velocity only)
+    #     note: UFL as_vector() takes UFL expressions and combines; DirichletBC
+    #     accepts such UFL expressions directly
+    if args.analytical:
+        assert (len(args.mesh) == 0)  # require UnitSquareMesh
+        assert (args.mu == 1.0)
+        # trig factors shared by body force, boundary data, and exact solution
+        sx, cx = sin(4.0*pi*x), cos(4.0*pi*x)
+        sy, cy = sin(4.0*pi*y), cos(4.0*pi*y)
+        f_body = as_vector([ 28.0 * pi*pi * sx * cy, \
+                           -36.0 * pi*pi * cx * sy])
+        u_12 = as_vector([0.0,-sy])
+        u_34 = as_vector([sx,0.0])
+        bcs = [ DirichletBC(Z.sub(0), u_12, (1,2)),
+                DirichletBC(Z.sub(0), u_34, (3,4)) ]
+    else:
+        f_body = Constant((0.0, 0.0))  # no body force in lid-driven cavity
+        u_noslip = Constant((0.0, 0.0))
+        ux_lid = args.lidscale * x * (1.0 - x)
+        u_lid = as_vector([ux_lid,0.0])
+        bcs = [ DirichletBC(Z.sub(0), u_noslip, other),
+                DirichletBC(Z.sub(0), u_lid,    lid)   ]
 
-# describe mixed FE method
-uFEstr = '%s_%d' % (['P','Q'][args.quad],args.udegree)
-pFEstr = '%s_%d' % (['P','Q'][args.quad],args.pdegree)
-if args.dp:
-    mixedname = 'CD'
-else:
-    if args.pdegree == args.udegree - 1:
-        mixedname = 'Taylor-Hood'
+    # if Dirichlet-only b.c.s on velocity then set nullspace to constant pressure
+    if args.nobase:
+        ns = None
     else:
-        mixedname = ''
-PETSc.Sys.Print('solving%s with %s x %s %s elements ...' \
-                % (meshstr,uFEstr,pFEstr,mixedname))
+        ns = MixedVectorSpaceBasis(Z, [Z.sub(0), VectorSpaceBasis(constant=True)])
+
+    # define weak form; the problem is linear so it is  a(u,p;v,q) = L(v,q)
+    u,p = TrialFunctions(Z)
+    v,q = TestFunctions(Z)
+    if args.vectorlap:   # form which is special to constant viscosity
+        a = (args.mu * inner(grad(u), grad(v)) - p * div(v) - div(u) * q) * dx
+    else:                # form that generalizes to variable or nonlinear viscosity
+        Du = 0.5 * (grad(u)+grad(u).T)
+        Dv = 0.5 * (grad(v)+grad(v).T)
+        a = (2.0 * args.mu * inner(Du,Dv) - p * div(v) - div(u) * q) * dx
+    L = inner(f_body,v) * dx
+
+    # describe mixed FE method
+    uFEstr = '%s_%d' % (['P','Q'][args.quad],args.udegree)
+    pFEstr = '%s_%d' % (['P','Q'][args.quad],args.pdegree)
+    if args.dp:
+        mixedname = 'CD'
+    else:
+        if args.pdegree == args.udegree - 1:
+            mixedname = 'Taylor-Hood'
+        else:
+            mixedname = ''
+    PETSc.Sys.Print('solving%s with %s x %s %s elements ...' \
+                    % (meshstr,uFEstr,pFEstr,mixedname))
+
+    # actually solve; the package goes in as solver_parameters rather than
+    # into the global options database, because Firedrake lets -s_ options
+    # from the command line override solver_parameters (e.g. -s_ksp_type)
+    up = Function(Z)
+    problem = LinearVariationalProblem(a, L, up, bcs=bcs)
+    solver = LinearVariationalSolver(problem, nullspace=ns, options_prefix='s',
+                                     solver_parameters=sparams)
+    solver.solve()
+    u,p = up.subfunctions
 
-# actually solve
-solve(F == 0, up, bcs=bcs, nullspace=ns, options_prefix='s',
-      solver_parameters=sparams)
-u,p = up.split()
+    # numerical error for -analytical case ONLY
+    if args.analytical:
+        # compare Logg et al 2012, Fig 20.11; degree 10 is not necessary but same
+        # degree as computation spaces will yield wrong rates
+        Vhigh = VectorFunctionSpace(mesh, 'CG', degree=args.udegree+2)
+        Whigh = FunctionSpace(mesh, 'CG', degree=args.pdegree+2)
+        u_exact = Function(Vhigh).interpolate(as_vector([sx * cy, -cx * sy]))
+        p_exact = Function(Whigh).interpolate(pi * cx * cy)
+        uerr, perr = l2norms(mesh, u - u_exact, p - p_exact)
+        PETSc.Sys.Print('  numerical errors: |u-uexact|_h = %.2e, |p-pexact|_h = %.2e' \
+                        % (uerr, perr))
 
-# numerical error for -analytical case ONLY
-if args.analytical:
-    xexact = sin(4.0*pi*x) * cos(4.0*pi*y)
-    yexact = -cos(4.0*pi*x) * sin(4.0*pi*y)
-    # compare Logg et al 2012, Fig 20.11; degree 10 is not necessary but same
-    # degree as computation spaces will yield wrong rates
-    Vhigh = VectorFunctionSpace(mesh, 'CG', degree=args.udegree+2)
-    Whigh = FunctionSpace(mesh, 'CG', degree=args.pdegree+2)
-    u_exact = Function(Vhigh).interpolate(as_vector([xexact,yexact]))
-    p_exact = Function(Whigh).interpolate(pi * cos(4.0*pi*x) * cos(4.0*pi*y))
-    uerr = sqrt(assemble(dot(u - u_exact, u - u_exact) * dx))
-    perr = sqrt(assemble(dot(p - p_exact, p - p_exact) * dx))
-    PETSc.Sys.Print('  numerical errors: |u-uexact|_h = %.2e, |p-pexact|_h = %.2e' \
-                    % (uerr, perr))
+    # optionally print Schur/GMG package, number of degrees of freedom, and solution norms
+    if args.showinfo:
+        if len(args.schurgmg) > 0:
+            PETSc.Sys.Print('  Schur+GMG PC package %s + %s' \
+                            % (args.schurgmg,args.schurpre))
+        n_u,n_p = V.dim(),W.dim()
+        PETSc.Sys.Print('  sizes: n_u = %d, n_p = %d, N = %d' % (n_u,n_p,n_u+n_p))
+        uL2, pL2 = l2norms(mesh, u, p)
+        PETSc.Sys.Print('  solution norms: |u|_h = %.2e, |p|_h = %.2e' % (uL2, pL2))
 
-# optionally print Schur/GMG package, number of degrees of freedom, and solution norms
-if args.showinfo:
-    if len(args.schurgmg) > 0:
-        PETSc.Sys.Print('  Schur+GMG PC package %s + %s' \
-                        % (args.schurgmg,args.schurpre))
-    n_u,n_p = V.dim(),W.dim()
-    PETSc.Sys.Print('  sizes: n_u = %d, n_p = %d, N = %d' % (n_u,n_p,n_u+n_p))
-    uL2 = sqrt(assemble(dot(u, u) * dx))
-    pL2 = sqrt(assemble(dot(p, p) * dx))
-    PETSc.Sys.Print('  solution norms: |u|_h = %.2e, |p|_h = %.2e' % (uL2, pL2))
+    # optionally save to .pvd file viewable with Paraview
+    if len(args.o) > 0:
+        PETSc.Sys.Print('saving to %s ...' % args.o)
+        u.rename('velocity')
+        p.rename('pressure')
+        File(args.o).write(u,p)
 
-# optionally save to .pvd file viewable with Paraview
-if len(args.o) > 0:
-    PETSc.Sys.Print('saving to %s ...' % args.o)
-    u.rename('velocity')
-    p.rename('pressure')
-    File(args.o).write(u,p)
+if __name__ == '__main__':
+    # read Gmsh mesh or create uniform coarse mesh
+    if len(args.mesh) > 0:
+        assert (not args.analytical), 'Gmsh file not allowed for -analytical problem'
+        assert (not args.nobase), 'Gmsh file not allowed for -nobase problem'
+        PETSc.Sys.Print('reading mesh from %s ...' % args.mesh)
+        mesh = Mesh(args.mesh)
+    else:
+        mesh = UnitSquareMesh(args.mx-1, args.my-1, quadrilateral=args.quad)
+
+    # enable GMG using hierarchy; one hierarchy serves all -sweep levels, and
+    # it stays referenced here so that its coarse meshes live through solves
+    if len(args.sweep) > 0:
+        levels = [int(r) for r in args.sweep.split(',')]
+    else:
+        levels = [args.refine]
+    assert min(levels) >= 0, 'refinement levels must be nonnegative'
+    hierarchy = MeshHierarchy(mesh, max(levels)) if max(levels) > 0 else [mesh]
 
+    for refine in levels:
+        args.refine = refine
+        run(args, hierarchy[refine])
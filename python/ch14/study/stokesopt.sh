@@ -7,6 +7,7 @@ set +x
 
 # problem is default lid-driven cavity with Dirichlet on whole boundary
 # FE method is Q^2 x Q^1 Taylor-Hood
+# note: with -quad, -schurpre mass applies diag(M)^{-1}, not bjacobi+icc on M
 
 MAXLEV=10   # LEV=9 is 1025x1025 uniform grid with N~~10^7, LEV=10 is 2049^2
 